@@ -1,8 +1,11 @@
 """Dynamic Dialog System - Create tkinter dialogs from simple text templates."""
 
-from core.dialog import Dialog, create_dialog
-from core.parser import TemplateParser
+from core.dialog import Dialog, compile_template, create_dialog, show_all, shutdown
+from core.parser import FieldSpec, TemplateParser
 from core.fields import FieldFactory
+from core.exceptions import DialogError, TemplateError
 
-__all__ = ['Dialog', 'create_dialog', 'TemplateParser', 'FieldFactory']
-
+__all__ = [
+    'Dialog', 'create_dialog', 'compile_template', 'show_all', 'shutdown',
+    'TemplateParser', 'FieldSpec', 'FieldFactory', 'DialogError', 'TemplateError',
+]
@@ -1,124 +1,205 @@
 """Dialog manager for creating and displaying dialogs."""
 
-import importlib
 import logging
 import sys
 import tkinter as tk
+from functools import lru_cache, partial
 from pathlib import Path
-from typing import Any, Callable, Dict, Optional, Union
+from types import MappingProxyType
+from typing import Any, Callable, Dict, Iterable, List, Mapping, Optional, Union
 
 from core.fields import FieldFactory
 from core.parser import TemplateParser
 
 logger = logging.getLogger(__name__)
 
+_FOCUSABLE_TYPES = frozenset(('text', 'multiline', 'selection'))
+
+# Pre-bound constructors for the widgets every dialog creates
+_padded_frame = partial(tk.Frame, padx=10, pady=10)
+_dialog_button = partial(tk.Button, width=10)
+
+# Vertical room left for the window title bar and desktop panels when
+# capping the height of dialogs without an explicit size
+_SCREEN_HEIGHT_MARGIN = 80
+
+# Requested height of the scrollable canvas; it expands to whatever height
+# the window gives it, so this only has to be small enough never to crowd out
+# the button bar
+_SCROLL_CANVAS_HEIGHT = 100
+
+# Shared, withdrawn Tk root; each dialog is a Toplevel on this interpreter
+_hidden_root: Optional[tk.Tk] = None
+
+
+def _get_hidden_root() -> tk.Tk:
+    """Return the shared hidden root, creating it on first use."""
+    global _hidden_root
+    if _hidden_root is None:
+        _hidden_root = tk.Tk()
+        _hidden_root.withdraw()
+        logger.debug("Created hidden Tk root")
+    return _hidden_root
+
+
+def shutdown():
+    """Destroy the shared hidden Tk root, e.g. at application exit."""
+    global _hidden_root
+    if _hidden_root is not None:
+        _hidden_root.destroy()
+        _hidden_root = None
+        logger.debug("Destroyed hidden Tk root")
+
 
 class Dialog:
     """Main dialog class for creating and managing dialogs."""
 
+    # Callbacks registered by name, referenced in templates as '@name'
+    _callbacks: Dict[str, Callable] = {}
+    # Read-only live view of the registry; use register_callback() to add entries
+    callbacks: Mapping[str, Callable] = MappingProxyType(_callbacks)
+
     def __init__(self, template: Union[str, Path]):
         """Initialize dialog with a template."""
-        self.template = template
-        self.root = None
-        self.fields = []
-        self.result = None
-        self.first_focusable_widget = None
-        
         # Parse template
         try:
             parser = TemplateParser(template)
-            self.config = parser.parse()
-            logger.info(f"Parsed template: {self.config['title']}")
+            config = parser.parse()
+            logger.info("Parsed template: %s", config['title'])
         except Exception as e:
-            logger.error(f"Failed to parse template: {e}")
+            logger.error("Failed to parse template: %s", e)
             raise
 
+        self._setup(template, config)
+
+    @classmethod
+    def register_callback(cls, name: str, callback: Callable):
+        """Register a callback so templates can reference it as '@name'."""
+        if not callable(callback):
+            raise TypeError(f"Callback '{name}' is not callable")
+        cls._callbacks[name] = callback
+        logger.debug("Registered callback: %s", name)
+
+    @classmethod
+    def from_parsed(cls, config: Dict) -> 'Dialog':
+        """Create a dialog from a config already returned by TemplateParser.parse()."""
+        dialog = cls.__new__(cls)
+        dialog._setup(None, config)
+        return dialog
+
+    def _setup(self, template: Optional[Union[str, Path]], config: Dict):
+        """Initialize dialog state for a parsed template config."""
+        self.template = template
+        self.config = config
+        self.master = None
+        self.root = None
+        self._scroll_canvas = None
+        self.fields = []
+        self.result = None
+        self.first_focusable_widget = None
+
+        # Parallel name/getter lists and a name index, filled by _build_fields
+        self._field_names = []
+        self._field_getters = []
+        self._field_by_name = {}
+
+    def attach(self, master: tk.Misc) -> 'Dialog':
+        """Show this dialog on an existing Tk root instead of the shared hidden one."""
+        self.master = master
+        return self
+
     @property
     def values(self) -> Dict[str, Any]:
         """Get current values from all fields."""
-        values = {}
-        for field in self.fields:
-            value = field.get_value()
-            # Only include fields that have values (exclude buttons, dividers)
-            if value is not None:
-                values[field.name] = value
-        return values
+        # Only include fields that have values (exclude buttons, dividers)
+        return {
+            name: value
+            for name, value in zip(self._field_names, [get() for get in self._field_getters])
+            if value is not None
+        }
 
     def set_field_value(self, field_name: str, value: Any) -> bool:
         """Set the value of a field by name."""
-        for field in self.fields:
-            if field.name == field_name:
-                try:
-                    field.set_value(value)
-                    logger.debug(f"Set field '{field_name}' to value: {value}")
-                    return True
-                except Exception as e:
-                    logger.error(f"Error setting field '{field_name}': {e}")
-                    return False
-        logger.warning(f"Field '{field_name}' not found in dialog")
-        return False
+        field = self._field_by_name.get(field_name)
+        if field is None:
+            logger.warning("Field '%s' not found in dialog", field_name)
+            return False
+
+        try:
+            field.set_value(value)
+            logger.debug("Set field '%s' to value: %s", field_name, value)
+            return True
+        except Exception as e:
+            logger.error("Error setting field '%s': %s", field_name, e)
+            return False
+
+    def set_field_values(self, values: Dict[str, Any]) -> bool:
+        """Set several fields at once from a name -> value mapping.
+
+        Returns True only if every field was found and set.
+        """
+        set_field_value = self.set_field_value
+        return all([set_field_value(name, value) for name, value in values.items()])
 
     def show(self) -> Optional[Dict[str, Any]]:
         """Display the dialog and return the result."""
         self.result = None
         
-        # Create root window
-        self.root = tk.Tk()
+        # Create dialog window on the shared interpreter
+        self.root = tk.Toplevel(self.master or _get_hidden_root())
         self.root.title(self.config['title'])
         
         # Set size if specified
         if self.config['size']:
             width, height = self.config['size']
             self.root.geometry(f"{width}x{height}")
-            logger.debug(f"Set window size: {width}x{height}")
+            logger.debug("Set window size: %sx%s", width, height)
+        else:
+            # Unsized windows grow to fit their content; cap them below the screen
+            # height so oversized forms overflow into the scrollable area instead
+            self.root.maxsize(
+                self.root.winfo_screenwidth(),
+                self.root.winfo_screenheight() - _SCREEN_HEIGHT_MARGIN,
+            )
         
         # Create main frame with padding
-        main_frame = tk.Frame(self.root, padx=10, pady=10)
-        main_frame.pack(fill=tk.BOTH, expand=True)
+        main_frame = _padded_frame(self.root)
         
-        # Create scrollable content area
-        canvas = tk.Canvas(main_frame)
-        scrollbar = tk.Scrollbar(main_frame, orient="vertical", command=canvas.yview)
-        scrollable_frame = tk.Frame(canvas)
+        # Build fields once into a plain frame inside an unpadded viewport. If the
+        # viewport ever gets less height than the fields need (at first show or
+        # after a resize), the same frame is moved into a scrollable canvas
+        viewport = tk.Frame(main_frame)
+        viewport.pack(fill=tk.BOTH, expand=True)
+        content_frame = tk.Frame(viewport)
+        self._build_fields(content_frame)
         
-        scrollable_frame.bind(
-            "<Configure>",
-            lambda e: canvas.configure(scrollregion=canvas.bbox("all"))
-        )
-        
-        window_id = canvas.create_window((0, 0), window=scrollable_frame, anchor="nw")
-        canvas.configure(yscrollcommand=scrollbar.set)
-        
-        # Make scrollable_frame expand with canvas width
-        def _on_canvas_configure(event):
-            canvas.itemconfig(window_id, width=event.width)
-        canvas.bind("<Configure>", _on_canvas_configure)
-        
-        # Build fields
-        self._build_fields(scrollable_frame)
-        
-        # Pack canvas and scrollbar
-        canvas.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
-        scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+        # Keep fields at their natural heights, stacked from the top, like the
+        # canvas window item did; spare window height stays below them
+        content_frame.pack(fill=tk.X, anchor='n')
+        self._scroll_canvas = None
+        viewport.bind("<Configure>", lambda event: self._on_viewport_configure(event, content_frame))
         
-        # Create button frame at bottom
-        button_frame = tk.Frame(self.root, padx=10, pady=10)
+        # Create button frame at bottom. Created after the fields to keep them first
+        # in Tab order, but packed before the main frame so the packer reserves its
+        # height first and overflowing fields can't push it out of the window
+        button_frame = _padded_frame(self.root)
         button_frame.pack(side=tk.BOTTOM, fill=tk.X)
         
         # Add OK and Cancel buttons
-        ok_btn = tk.Button(button_frame, text="OK", command=self._on_ok, width=10)
+        ok_btn = _dialog_button(button_frame, text="OK", command=self._on_ok)
         ok_btn.pack(side=tk.RIGHT, padx=5)
         
-        cancel_btn = tk.Button(button_frame, text="Cancel", command=self._on_cancel, width=10)
+        cancel_btn = _dialog_button(button_frame, text="Cancel", command=self._on_cancel)
         cancel_btn.pack(side=tk.RIGHT, padx=5)
         
+        main_frame.pack(fill=tk.BOTH, expand=True)
+        
         # Bind keyboard shortcuts
         self.root.bind("<Escape>", lambda event: self._on_cancel())
         self.root.bind("<Control-Return>", lambda event: self._on_ok())
         logger.debug("Bound keyboard shortcuts: Escape for Cancel, Ctrl+Enter for OK")
         
-        # Center window on screen
-        self.root.update_idletasks()
+        # Center window on screen (flushes pending layout itself)
         self._center_window()
         
         # Make dialog modal
@@ -131,110 +212,144 @@ class Dialog:
         else:
             self.root.focus_force()
         
-        logger.info(f"Showing dialog: {self.config['title']}")
+        logger.info("Showing dialog: %s", self.config['title'])
         
-        # Start main loop
-        self.root.mainloop()
+        # Run the event loop until this dialog window is destroyed
+        self.root.wait_window()
         
         return self.result
 
+    def _on_viewport_configure(self, event: tk.Event, content: tk.Widget):
+        """Switch to a scrollable canvas once the fields no longer fit the viewport."""
+        if self._scroll_canvas is None and content.winfo_reqheight() > event.height:
+            logger.debug("Dialog content overflows window, using scrollable area")
+            self._enable_scrolling(event.widget, content)
+
+    def _enable_scrolling(self, viewport: tk.Widget, content: tk.Widget):
+        """Move the already built content frame into a vertically scrollable canvas."""
+        scrollbar = tk.Scrollbar(viewport, orient="vertical")
+        
+        # Keep the current window size, which a small canvas request would shrink
+        if not self.config['size']:
+            self.root.geometry(f"{self.root.winfo_width()}x{self.root.winfo_height()}")
+        
+        canvas = tk.Canvas(
+            viewport,
+            width=max(viewport.winfo_width() - scrollbar.winfo_reqwidth(), 1),
+            height=_SCROLL_CANVAS_HEIGHT,
+            highlightthickness=0,
+        )
+        scrollbar.configure(command=canvas.yview)
+        canvas.configure(yscrollcommand=scrollbar.set)
+        
+        # The content frame is a sibling of the canvas (Tk allows embedding any
+        # descendant of the canvas's parent), so it must be raised above the canvas
+        # to stay visible; the viewport clips it to the canvas area
+        content.pack_forget()
+        window_id = canvas.create_window((0, 0), window=content, anchor="nw")
+        content.lift(canvas)
+        
+        content.bind(
+            "<Configure>",
+            lambda e: canvas.configure(scrollregion=canvas.bbox("all"))
+        )
+        
+        # Make content expand with canvas width
+        def _on_canvas_configure(event):
+            canvas.itemconfig(window_id, width=event.width)
+        canvas.bind("<Configure>", _on_canvas_configure)
+        
+        scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+        canvas.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+        self._scroll_canvas = canvas
+
     def _resolve_callback(self, callback_str: str) -> Optional[Callable]:
         """Resolve a callback string to an actual callable function."""
         if not callback_str:
             return None
-            
+
+        # Registered callbacks are a direct lookup, no import or getattr needed
+        if callback_str.startswith('@'):
+            callback = self._callbacks.get(callback_str[1:])
+            if callback is None:
+                logger.warning("Callback '%s' is not registered", callback_str)
+            return callback
+
         try:
-            # Check if callback string contains a dot (module.function format)
-            if '.' in callback_str:
-                parts = callback_str.rsplit('.', 1)
-                module_name = parts[0]
-                function_name = parts[1]
-                
-                try:
-                    # Try to import the module
-                    module = importlib.import_module(module_name)
-                    callback = getattr(module, function_name, None)
-                    
-                    if callback and callable(callback):
-                        logger.debug(f"Resolved callback: {callback_str}")
-                        return callback
-                    else:
-                        logger.warning(f"Callback '{callback_str}' not found or not callable")
-                        return None
-                        
-                except (ImportError, AttributeError) as e:
-                    logger.warning(f"Failed to import callback '{callback_str}': {e}")
-                    return None
-            else:
-                # No dot, search in __main__ module namespace
-                main_module = sys.modules.get('__main__')
-                if main_module:
-                    callback = getattr(main_module, callback_str, None)
-                    
-                    if callback and callable(callback):
-                        logger.debug(f"Resolved callback from __main__: {callback_str}")
-                        return callback
-                    else:
-                        logger.warning(f"Callback '{callback_str}' not found in __main__ module")
-                        return None
-                else:
-                    logger.warning(f"__main__ module not available, cannot resolve '{callback_str}'")
-                    return None
-                    
+            return _resolve_callback_cached(callback_str)
+        except LookupError as e:
+            logger.warning(str(e))
+            return None
         except Exception as e:
-            logger.error(f"Error resolving callback '{callback_str}': {e}")
+            logger.error("Error resolving callback '%s': %s", callback_str, e)
             return None
 
     def _build_fields(self, parent: tk.Widget):
         """Build all fields from the configuration."""
+        create_field = FieldFactory.create_field
+        containers = []
+
+        # Start from a clean slate so re-showing the dialog doesn't keep stale widgets
+        self.fields = []
+        self.first_focusable_widget = None
+        self._field_names = []
+        self._field_getters = []
+        self._field_by_name = {}
+
         for field_data in self.config['fields']:
+            fname = field_data.name
+            ftype = field_data.type
             try:
                 # For button fields, resolve the callback
-                if field_data['type'] == 'button':
-                    callback_str = field_data.get('callback')
+                if ftype == 'button':
+                    fcallback = field_data.callback
                     callback = None
                     
-                    if callback_str:
-                        resolved_callback = self._resolve_callback(callback_str)
+                    if fcallback:
+                        resolved_callback = self._resolve_callback(fcallback)
                         if resolved_callback:
                             # Wrap callback to pass dialog object
-                            def callback(dialog_ref=self, cb=resolved_callback):
+                            def callback(dialog_ref=self, cb=resolved_callback, cb_name=fcallback):
                                 try:
                                     cb(dialog_ref)
-                                    logger.debug(f"Executed callback: {callback_str}")
+                                    logger.debug("Executed callback: %s", cb_name)
                                 except Exception as e:
-                                    logger.error(f"Error in button callback '{callback_str}': {e}")
+                                    logger.error("Error in button callback '%s': %s", cb_name, e)
                     
-                    field = FieldFactory.create_field(parent, field_data, callback)
+                    field = create_field(parent, field_data, callback)
                 else:
-                    field = FieldFactory.create_field(parent, field_data)
+                    field = create_field(parent, field_data)
                 
                 # Create the widget
-                widget_container = field.create()
-                widget_container.pack(fill=tk.BOTH, expand=True, pady=5)
+                containers.append(field.create())
                 
                 # Store field reference (skip dividers)
-                if field_data['type'] != 'divider':
+                if ftype != 'divider':
                     self.fields.append(field)
+                    self._field_names.append(fname)
+                    self._field_getters.append(field.get_value)
+                    self._field_by_name.setdefault(fname, field)
                 
                 # Track first focusable widget
-                if self.first_focusable_widget is None:
-                    focusable_types = ['text', 'multiline', 'selection']
-                    if field_data['type'] in focusable_types:
-                        self.first_focusable_widget = field.widget
+                if self.first_focusable_widget is None and ftype in _FOCUSABLE_TYPES:
+                    self.first_focusable_widget = field.widget
                 
             except Exception as e:
-                logger.error(f"Failed to create field {field_data.get('name', 'unknown')}: {e}")
+                logger.error("Failed to create field %s: %s", fname, e)
                 raise
 
+        # Pack all containers in one pass once every field has been created
+        for widget_container in containers:
+            widget_container.pack(fill=tk.BOTH, expand=True, pady=5)
+
     def _on_ok(self):
         """Handle OK button click."""
         try:
             self.result = self.values
-            logger.info(f"Dialog OK clicked with values: {self.result}")
+            logger.info("Dialog OK clicked with values: %s", self.result)
             self.root.destroy()
         except Exception as e:
-            logger.error(f"Error getting dialog values: {e}")
+            logger.error("Error getting dialog values: %s", e)
             self.result = None
             self.root.destroy()
 
@@ -263,7 +378,62 @@ class Dialog:
         self.root.geometry(f"+{x}+{y}")
 
 
+@lru_cache(maxsize=256)
+def _resolve_callback_cached(callback_str: str) -> Callable:
+    """Resolve a callback string to a callable, caching successful lookups.
+
+    Raises LookupError when the callback cannot be resolved; failures are not
+    cached, so a later attempt can still succeed. Call cache_clear() to pick up
+    reloaded modules.
+    """
+    # Check if callback string contains a dot (module.function format)
+    if '.' in callback_str:
+        # Only dotted callbacks need importlib, so defer the import
+        import importlib
+
+        module_name, _, function_name = callback_str.rpartition('.')
+
+        try:
+            # Try to import the module
+            module = importlib.import_module(module_name)
+            callback = getattr(module, function_name, None)
+        except (ImportError, AttributeError) as e:
+            raise LookupError(f"Failed to import callback '{callback_str}': {e}") from e
+
+        if callback and callable(callback):
+            logger.debug("Resolved callback: %s", callback_str)
+            return callback
+        raise LookupError(f"Callback '{callback_str}' not found or not callable")
+
+    # No dot, search in __main__ module namespace
+    main_module = sys.modules.get('__main__')
+    if not main_module:
+        raise LookupError(f"__main__ module not available, cannot resolve '{callback_str}'")
+
+    callback = getattr(main_module, callback_str, None)
+    if callback and callable(callback):
+        logger.debug("Resolved callback from __main__: %s", callback_str)
+        return callback
+    raise LookupError(f"Callback '{callback_str}' not found in __main__ module")
+
+
 def create_dialog(template: Union[str, Path]) -> Dialog:
     """Convenience function to create a Dialog instance."""
     return Dialog(template)
 
+
+def show_all(dialogs: Iterable[Dialog], master: Optional[tk.Misc] = None) -> List[Optional[Dict[str, Any]]]:
+    """Show dialogs one after another on a single Tk root and return their results."""
+    results = []
+    for dialog in dialogs:
+        if master is not None:
+            dialog.attach(master)
+        results.append(dialog.show())
+    return results
+
+
+def compile_template(template: Union[str, Path]) -> Callable[[], Dialog]:
+    """Parse a template once and return a factory that builds fresh dialogs from it."""
+    config = TemplateParser(template).parse()
+    logger.info("Compiled template: %s", config['title'])
+    return partial(Dialog.from_parsed, config)
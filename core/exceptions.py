@@ -0,0 +1,9 @@
+"""Exceptions raised by dynamic dialogs."""
+
+
+class DialogError(Exception):
+    """Base class for errors raised by dyna-dialogs."""
+
+
+class TemplateError(DialogError, ValueError):
+    """Raised when a template is malformed or cannot be parsed."""
@@ -3,15 +3,39 @@
 import logging
 import tkinter as tk
 from tkinter import ttk
-from typing import Any, Callable, Dict, List, Optional
+from typing import Any, Callable, List, Optional, Sequence
+
+from core.exceptions import TemplateError
+from core.parser import FieldSpec
 
 logger = logging.getLogger(__name__)
 
+# Shared pack() options, built once instead of at every call site
+_LABEL_PACK = dict(side=tk.TOP, fill=tk.X, pady=(0, 2))
+_ENTRY_PACK = dict(side=tk.TOP, fill=tk.BOTH, expand=True)
+
+# Tcl lambdas (run with `apply`) that create and pack one button per option in a
+# single interpreter call instead of several Python/Tcl round trips per option
+_CHECKBUTTONS_SCRIPT = """{parent labels vars} {
+    set i 0
+    foreach label $labels var $vars {
+        checkbutton $parent.opt[incr i] -text $label -variable $var
+        pack $parent.opt$i -side top -anchor w -padx {20 0}
+    }
+}"""
+_RADIOBUTTONS_SCRIPT = """{parent labels var} {
+    set i 0
+    foreach label $labels {
+        radiobutton $parent.opt[incr i] -text $label -variable $var -value $label
+        pack $parent.opt$i -side top -anchor w -padx {20 0}
+    }
+}"""
+
 
 class BaseField:
     """Base class for all field types."""
 
-    def __init__(self, parent: tk.Widget, name: str, options: List[str] = None):
+    def __init__(self, parent: tk.Widget, name: str, options: Sequence[str] = None):
         """Initialize the field."""
         self.parent = parent
         self.name = name
@@ -23,6 +47,12 @@ class BaseField:
         """Create and return the widget container."""
         raise NotImplementedError("Subclasses must implement create()")
 
+    def _create_label(self, container: tk.Widget) -> tk.Label:
+        """Create and pack the field's name label at the top of the container."""
+        self.label = tk.Label(container, text=self.name, anchor='w')
+        self.label.pack(**_LABEL_PACK)
+        return self.label
+
     def get_value(self) -> Any:
         """Extract and return the current value of the field."""
         raise NotImplementedError("Subclasses must implement get_value()")
@@ -40,14 +70,13 @@ class TextField(BaseField):
         container = tk.Frame(self.parent)
         
         # Create label
-        self.label = tk.Label(container, text=self.name, anchor='w')
-        self.label.pack(side=tk.TOP, fill=tk.X, pady=(0, 2))
+        self._create_label(container)
         
         # Create entry
         self.widget = tk.Entry(container)
-        self.widget.pack(side=tk.TOP, fill=tk.BOTH, expand=True)
+        self.widget.pack(**_ENTRY_PACK)
         
-        logger.debug(f"Created text field: {self.name}")
+        logger.debug("Created text field: %s", self.name)
         return container
 
     def get_value(self) -> str:
@@ -58,7 +87,7 @@ class TextField(BaseField):
         """Set the text value."""
         self.widget.delete(0, tk.END)
         self.widget.insert(0, str(value))
-        logger.debug(f"Set text field '{self.name}' to: {value}")
+        logger.debug("Set text field '%s' to: %s", self.name, value)
 
 
 class MultilineField(BaseField):
@@ -69,12 +98,11 @@ class MultilineField(BaseField):
         container = tk.Frame(self.parent)
         
         # Create label
-        self.label = tk.Label(container, text=self.name, anchor='w')
-        self.label.pack(side=tk.TOP, fill=tk.X, pady=(0, 2))
+        self._create_label(container)
         
         # Create frame for text and scrollbar
         text_frame = tk.Frame(container)
-        text_frame.pack(side=tk.TOP, fill=tk.BOTH, expand=True)
+        text_frame.pack(**_ENTRY_PACK)
         
         # Create scrollbar
         scrollbar = tk.Scrollbar(text_frame)
@@ -85,7 +113,7 @@ class MultilineField(BaseField):
         self.widget.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
         scrollbar.config(command=self.widget.yview)
         
-        logger.debug(f"Created multiline field: {self.name}")
+        logger.debug("Created multiline field: %s", self.name)
         return container
 
     def get_value(self) -> str:
@@ -96,7 +124,7 @@ class MultilineField(BaseField):
         """Set the text content."""
         self.widget.delete('1.0', tk.END)
         self.widget.insert('1.0', str(value))
-        logger.debug(f"Set multiline field '{self.name}' to: {value}")
+        logger.debug("Set multiline field '%s' to: %s", self.name, value)
 
 
 class SelectionField(BaseField):
@@ -107,16 +135,15 @@ class SelectionField(BaseField):
         container = tk.Frame(self.parent)
         
         # Create label
-        self.label = tk.Label(container, text=self.name, anchor='w')
-        self.label.pack(side=tk.TOP, fill=tk.X, pady=(0, 2))
+        self._create_label(container)
         
         # Create combobox
         self.widget = ttk.Combobox(container, values=self.options, state='readonly')
         if self.options:
             self.widget.current(0)  # Select first option by default
-        self.widget.pack(side=tk.TOP, fill=tk.BOTH, expand=True)
+        self.widget.pack(**_ENTRY_PACK)
         
-        logger.debug(f"Created selection field: {self.name} with options: {self.options}")
+        logger.debug("Created selection field: %s with options: %s", self.name, self.options)
         return container
 
     def get_value(self) -> str:
@@ -128,15 +155,15 @@ class SelectionField(BaseField):
         value_str = str(value).strip()
         if value_str in self.options:
             self.widget.set(value_str)
-            logger.debug(f"Set selection field '{self.name}' to: {value_str}")
+            logger.debug("Set selection field '%s' to: %s", self.name, value_str)
         else:
-            logger.warning(f"Value '{value_str}' not in options for field '{self.name}': {self.options}")
+            logger.warning("Value '%s' not in options for field '%s': %s", value_str, self.name, self.options)
 
 
 class CheckgroupField(BaseField):
     """Multiple checkbox group field."""
 
-    def __init__(self, parent: tk.Widget, name: str, options: List[str] = None):
+    def __init__(self, parent: tk.Widget, name: str, options: Sequence[str] = None):
         """Initialize checkgroup field."""
         super().__init__(parent, name, options)
         self.check_vars = []
@@ -146,18 +173,17 @@ class CheckgroupField(BaseField):
         container = tk.Frame(self.parent)
         
         # Create label
-        self.label = tk.Label(container, text=self.name, anchor='w')
-        self.label.pack(side=tk.TOP, fill=tk.X, pady=(0, 2))
+        self._create_label(container)
         
-        # Create checkboxes
-        self.check_vars = []
-        for option in self.options:
-            var = tk.BooleanVar()
-            cb = tk.Checkbutton(container, text=option, variable=var)
-            cb.pack(side=tk.TOP, anchor='w', padx=(20, 0))
-            self.check_vars.append((option, var))
+        # Create checkboxes in one Tcl call, bound to Python-side variables
+        self.check_vars = [(option, tk.BooleanVar(container)) for option in self.options]
+        if self.check_vars:
+            container.tk.call(
+                'apply', _CHECKBUTTONS_SCRIPT, str(container),
+                tuple(self.options), tuple(str(var) for _, var in self.check_vars)
+            )
         
-        logger.debug(f"Created checkgroup field: {self.name} with {len(self.options)} options")
+        logger.debug("Created checkgroup field: %s with %s options", self.name, len(self.options))
         return container
 
     def get_value(self) -> List[str]:
@@ -178,34 +204,35 @@ class CheckgroupField(BaseField):
         for option, var in self.check_vars:
             var.set(option in values)
         
-        logger.debug(f"Set checkgroup field '{self.name}' to: {values}")
+        logger.debug("Set checkgroup field '%s' to: %s", self.name, values)
 
 
 class RadioField(BaseField):
     """Radio button group field."""
 
-    def __init__(self, parent: tk.Widget, name: str, options: List[str] = None):
+    def __init__(self, parent: tk.Widget, name: str, options: Sequence[str] = None):
         """Initialize radio field."""
         super().__init__(parent, name, options)
-        self.radio_var = tk.StringVar()
+        self.radio_var = None
 
     def create(self) -> tk.Widget:
         """Create radio button group with label."""
         container = tk.Frame(self.parent)
         
         # Create label
-        self.label = tk.Label(container, text=self.name, anchor='w')
-        self.label.pack(side=tk.TOP, fill=tk.X, pady=(0, 2))
+        self._create_label(container)
         
-        # Create radio buttons
+        # Create radio buttons sharing one variable, allocated only once the widget exists,
+        # all in one Tcl call
+        self.radio_var = tk.StringVar(container)
         if self.options:
             self.radio_var.set(self.options[0])  # Select first by default
+            container.tk.call(
+                'apply', _RADIOBUTTONS_SCRIPT, str(container),
+                tuple(self.options), str(self.radio_var)
+            )
         
-        for option in self.options:
-            rb = tk.Radiobutton(container, text=option, variable=self.radio_var, value=option)
-            rb.pack(side=tk.TOP, anchor='w', padx=(20, 0))
-        
-        logger.debug(f"Created radio field: {self.name} with {len(self.options)} options")
+        logger.debug("Created radio field: %s with %s options", self.name, len(self.options))
         return container
 
     def get_value(self) -> str:
@@ -217,15 +244,15 @@ class RadioField(BaseField):
         value_str = str(value).strip()
         if value_str in self.options:
             self.radio_var.set(value_str)
-            logger.debug(f"Set radio field '{self.name}' to: {value_str}")
+            logger.debug("Set radio field '%s' to: %s", self.name, value_str)
         else:
-            logger.warning(f"Value '{value_str}' not in options for field '{self.name}': {self.options}")
+            logger.warning("Value '%s' not in options for field '%s': %s", value_str, self.name, self.options)
 
 
 class ButtonField(BaseField):
     """Custom button field."""
 
-    def __init__(self, parent: tk.Widget, name: str, options: List[str] = None, 
+    def __init__(self, parent: tk.Widget, name: str, options: Sequence[str] = None, 
                  callback: Optional[Callable] = None):
         """Initialize button field."""
         super().__init__(parent, name, options)
@@ -239,7 +266,7 @@ class ButtonField(BaseField):
         self.widget = tk.Button(container, text=self.name, command=self._on_click)
         self.widget.pack(side=tk.TOP, pady=5)
         
-        logger.debug(f"Created button field: {self.name}")
+        logger.debug("Created button field: %s", self.name)
         return container
 
     def _on_click(self):
@@ -247,7 +274,7 @@ class ButtonField(BaseField):
         if self.callback:
             self.callback()
         else:
-            logger.warning(f"No callback set for button: {self.name}")
+            logger.warning("No callback set for button: %s", self.name)
 
     def get_value(self) -> None:
         """Buttons don't have a value."""
@@ -255,7 +282,7 @@ class ButtonField(BaseField):
 
     def set_value(self, value):
         """Buttons don't have a value to set."""
-        logger.debug(f"Ignoring set_value for button: {self.name}")
+        logger.debug("Ignoring set_value for button: %s", self.name)
 
 
 class DividerField(BaseField):
@@ -284,32 +311,23 @@ class DividerField(BaseField):
 class FieldFactory:
     """Factory for creating field instances."""
 
-    _field_types = {
-        'text': TextField,
-        'multiline': MultilineField,
-        'selection': SelectionField,
-        'checkgroup': CheckgroupField,
-        'radio': RadioField,
-        'button': ButtonField,
-        'divider': DividerField
+    # Each factory takes (parent, name, options, callback); only buttons use the callback
+    _factories = {
+        'text': lambda p, n, o, cb: TextField(p, n, o),
+        'multiline': lambda p, n, o, cb: MultilineField(p, n, o),
+        'selection': lambda p, n, o, cb: SelectionField(p, n, o),
+        'checkgroup': lambda p, n, o, cb: CheckgroupField(p, n, o),
+        'radio': lambda p, n, o, cb: RadioField(p, n, o),
+        'button': lambda p, n, o, cb: ButtonField(p, n, o, cb),
+        'divider': lambda p, n, o, cb: DividerField(p, n, o)
     }
 
     @classmethod
-    def create_field(cls, parent: tk.Widget, field_data: Dict, 
+    def create_field(cls, parent: tk.Widget, field_data: FieldSpec,
                      callback: Optional[Callable] = None) -> BaseField:
         """Create a field instance based on field data."""
-        field_type = field_data['type']
-        field_name = field_data['name']
-        options = field_data.get('options', [])
-
-        if field_type not in cls._field_types:
-            raise ValueError(f"Unknown field type: {field_type}")
-
-        field_class = cls._field_types[field_type]
-        
-        # Button fields need callback
-        if field_type == 'button':
-            return field_class(parent, field_name, options, callback)
-        else:
-            return field_class(parent, field_name, options)
+        factory = cls._factories.get(field_data.type)
+        if factory is None:
+            raise TemplateError(f"Unknown field type: {field_data.type}")
 
+        return factory(parent, field_data.name, field_data.options, callback)
@@ -2,12 +2,37 @@
 
 import logging
 import os
+import stat
+import sys
+from collections import OrderedDict
+from functools import lru_cache
+from itertools import islice
 from pathlib import Path
-from typing import Dict, List, Union
+from typing import Dict, List, NamedTuple, Optional, Tuple, Union
+
+from core.exceptions import TemplateError
 
 logger = logging.getLogger(__name__)
 
 
+class FieldSpec(NamedTuple):
+    """Parsed description of a single template field."""
+
+    name: str
+    type: str
+    options: Tuple[str, ...] = ()
+    callback: Optional[str] = None
+
+
+_VALID_TYPES = frozenset(
+    ('text', 'multiline', 'selection', 'checkgroup', 'radio', 'button', 'divider')
+)
+
+# Template file contents keyed by path, holding (st_mtime_ns, text); LRU-bounded
+_FILE_CACHE_SIZE = 32
+_file_cache: "OrderedDict[str, Tuple[int, str]]" = OrderedDict()
+
+
 class TemplateParser:
     """Parses pipe-delimited dialog templates."""
 
@@ -32,39 +57,33 @@ class TemplateParser:
                 return template
 
             # Check if file exists
-            if os.path.isfile(template):
-                logger.info(f"Loading template from file: {template}")
+            try:
+                st = os.stat(template)
+            except (OSError, ValueError):
+                st = None
+
+            if st is not None and stat.S_ISREG(st.st_mode):
+                logger.info("Loading template from file: %s", template)
                 try:
-                    with open(template, 'r', encoding='utf-8') as f:
-                        return f.read()
+                    return _read_template_file(template, st.st_mtime_ns)
                 except Exception as e:
-                    logger.error(f"Failed to read template file: {e}")
+                    logger.error("Failed to read template file: %s", e)
                     raise
 
             # If no newlines and file doesn't exist, treat as string
             logger.debug("Template detected as string input")
             return template
 
-        raise ValueError("Template must be a string or Path object")
+        raise TemplateError("Template must be a string or Path object")
 
     def parse(self) -> Dict:
         """Parse the template and return structured data."""
-        lines = [line.strip() for line in self.template_str.strip().split('\n')]
-        lines = [line for line in lines if line]  # Remove empty lines
+        config = _parse_cached(self.template_str)
 
-        if not lines:
-            raise ValueError("Template is empty")
-
-        # Parse first line as title|size
-        self._parse_header(lines[0])
-
-        # Parse remaining lines as fields
-        for i, line in enumerate(lines[1:], start=2):
-            try:
-                self._parse_field(line)
-            except Exception as e:
-                logger.error(f"Error parsing line {i}: {line} - {e}")
-                raise ValueError(f"Invalid field format at line {i}: {line}") from e
+        # Field specs are immutable; only the list itself needs copying
+        self.title = config['title']
+        self.size = config['size']
+        self.fields = list(config['fields'])
 
         return {
             'title': self.title,
@@ -72,67 +91,122 @@ class TemplateParser:
             'fields': self.fields
         }
 
-    def _parse_header(self, line: str):
+    @staticmethod
+    def _parse_header(line: str) -> Tuple[str, Optional[Tuple[int, int]]]:
         """Parse the header line (title|size)."""
-        parts = line.split('|')
-        
-        if len(parts) < 1:
-            raise ValueError("Header must contain at least a title")
-
-        self.title = parts[0].strip()
+        title, _, rest = line.partition('|')
+        title = title.strip()
+        size = None
 
         # Parse size if provided (format: WxH or HxW)
-        if len(parts) > 1 and parts[1].strip():
-            size_str = parts[1].strip()
+        size_str = rest.partition('|')[0].strip()
+        if size_str:
             if 'x' in size_str.lower():
                 try:
                     width, height = size_str.lower().split('x')
-                    self.size = (int(width.strip()), int(height.strip()))
-                    logger.debug(f"Parsed size: {self.size}")
+                    size = (int(width.strip()), int(height.strip()))
+                    logger.debug("Parsed size: %s", size)
                 except ValueError:
-                    logger.warning(f"Invalid size format: {size_str}, using default")
-                    self.size = None
+                    logger.warning("Invalid size format: %s, using default", size_str)
+                    size = None
             else:
-                logger.warning(f"Invalid size format: {size_str}, expected WxH")
-
-    def _parse_field(self, line: str):
-        """Parse a field line (name|type|options)."""
-        parts = [p.strip() for p in line.split('|')]
-
-        if len(parts) < 2:
-            raise ValueError(f"Field must have at least name and type: {line}")
+                logger.warning("Invalid size format: %s, expected WxH", size_str)
 
-        field_name = parts[0]
-        field_type = parts[1]
+        return title, size
 
-        # Extract options (everything after type, comma-separated)
-        options = []
+    @staticmethod
+    def _parse_field(line: str) -> FieldSpec:
+        """Parse a field line (name|type|options)."""
+        field_name, sep, rest = line.partition('|')
+        if not sep:
+            raise TemplateError(f"Field must have at least name and type: {line}")
+
+        # Intern name and type so later comparisons against literals are identity checks
+        field_name = sys.intern(field_name.strip())
+        field_type, _, options_str = rest.partition('|')
+        field_type = sys.intern(field_type.strip())
+
+        # Extract options (everything after type, comma-separated).
+        # Dividers never take options, so skip the work for them entirely.
+        options = ()
         callback = None
-        if len(parts) > 2:
-            # Join all parts after type and split by comma
-            options_str = '|'.join(parts[2:])
-            if options_str:
-                # For button fields, treat the third part as callback instead of options
-                if field_type == 'button':
-                    callback = options_str.strip()
-                else:
-                    options = [opt.strip() for opt in options_str.split(',')]
+        if options_str and field_type != 'divider':
+            # Anything after the type is kept whole, including any further pipes
+            if '|' in options_str:
+                options_str = '|'.join(map(str.strip, options_str.split('|')))
+            else:
+                options_str = options_str.strip()
 
-        # Validate field type
-        valid_types = ['text', 'multiline', 'selection', 'checkgroup', 'radio', 'button', 'divider']
-        if field_type not in valid_types:
-            raise ValueError(f"Invalid field type: {field_type}. Must be one of {valid_types}")
-
-        field_data = {
-            'name': field_name,
-            'type': field_type,
-            'options': options
-        }
-        
-        # Add callback for button fields
-        if callback:
-            field_data['callback'] = callback
+            # For button fields, treat the third part as callback instead of options
+            if field_type == 'button':
+                callback = options_str or None
+            elif options_str:
+                options = tuple(opt.strip() for opt in options_str.split(','))
 
-        self.fields.append(field_data)
-        logger.debug(f"Parsed field: {field_data}")
+        # Validate field type
+        if field_type not in _VALID_TYPES:
+            raise TemplateError(f"Invalid field type: {field_type}. Must be one of {sorted(_VALID_TYPES)}")
+
+        field_data = FieldSpec(field_name, field_type, options, callback)
+
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Parsed field: %s", field_data)
+        return field_data
+
+
+def _read_template_file(path: str, mtime_ns: int) -> str:
+    """Read a template file, reusing the cached text while its mtime is unchanged."""
+    cached = _file_cache.get(path)
+    if cached is not None and cached[0] == mtime_ns:
+        _file_cache.move_to_end(path)
+        logger.debug("Using cached template file: %s", path)
+        return cached[1]
+
+    # Read the whole file in one call and decode once, skipping the text-mode
+    # wrapper; normalize line endings the way text mode would have
+    data = Path(path).read_bytes()
+    try:
+        text = data.decode('utf-8')
+    except UnicodeDecodeError as e:
+        raise TemplateError(f"Template file is not valid UTF-8: {path}") from e
+    if '\r' in text:
+        text = text.replace('\r\n', '\n').replace('\r', '\n')
+    _file_cache[path] = (mtime_ns, text)
+    _file_cache.move_to_end(path)
+    if len(_file_cache) > _FILE_CACHE_SIZE:
+        _file_cache.popitem(last=False)
+    return text
+
+
+@lru_cache(maxsize=128)
+def _parse_cached(template_str: str) -> Dict:
+    """Parse template content into a config dict, cached by content.
+
+    Callers must not mutate the returned dict; TemplateParser.parse() copies
+    the fields list.
+    """
+    # Strip and drop empty lines in a single pass
+    lines = [line for line in map(str.strip, template_str.split('\n')) if line]
+
+    if not lines:
+        raise TemplateError("Template is empty")
+
+    # Parse first line as title|size
+    title, size = TemplateParser._parse_header(lines[0])
+
+    # Parse remaining lines as fields, without copying the line list
+    fields = []
+    parse_field = TemplateParser._parse_field
+    for i, line in enumerate(islice(lines, 1, None), start=2):
+        try:
+            fields.append(parse_field(line))
+        except Exception as e:
+            logger.error("Error parsing line %s: %s - %s", i, line, e)
+            raise TemplateError(f"Invalid field format at line {i}: {line}") from e
+
+    return {
+        'title': title,
+        'size': size,
+        'fields': fields
+    }
 
@@ -11,148 +11,195 @@ After installation, see:
 """
 
 import logging
+import tempfile
+import tkinter as tk
 from pathlib import Path
+from types import MappingProxyType
 
-from core import Dialog, create_dialog
-from utils.logger import ProjectLogger
+from core import Dialog, DialogError, compile_template, create_dialog
 
 # Module-level logger (will be initialized in main)
 logger = logging.getLogger(__name__)
 
+# Banner separator line for the example log output
+_SEP = "=" * 60
+
+# Example templates, parsed once at import into reusable dialog factories
+_USER_SETTINGS_SRC = """
+User Settings|500x450
+username|text
+bio|multiline
+theme|selection|light,dark,auto
+notifications|checkgroup|email,sms,push
+role|radio|admin,user,guest
+reset|button|@reset
+|divider
+custom_action|button|@custom_action
+"""
+
+_CONTACT_SRC = """
+Contact Information|450x350
+full_name|text
+email|text
+phone|text
+preferred_contact|radio|email,phone,either
+message|multiline
+"""
+
+_LOGIN_SRC = """
+Login Form|400x300
+username|text
+password|text
+remember|checkgroup|Remember me
+|divider
+"""
+
+_USER_SETTINGS = compile_template(_USER_SETTINGS_SRC)
+_CONTACT = compile_template(_CONTACT_SRC)
+_LOGIN = compile_template(_LOGIN_SRC)
+
+
+def _banner(title: str) -> str:
+    """Return a banner block (blank line, separator, title, separator) as one string."""
+    return f"\n{_SEP}\n{title}\n{_SEP}"
+
+
+def _log_result(heading: str, result: dict):
+    """Log a dialog's returned values as a single multi-line record."""
+    if logger.isEnabledFor(logging.INFO):
+        lines = "\n".join(f"  {key}: {value}" for key, value in result.items())
+        logger.info("%s\n%s", heading, lines, stacklevel=2)
+
 
 def reset_callback(dialog):
     """Example callback for the reset button."""
-    logger.info("Reset button clicked!")
-    logger.info(f"Current dialog values: {dialog.values}")
+    _info = logger.info
+    _info("Reset button clicked!")
+    if logger.isEnabledFor(logging.INFO):
+        _info("Current dialog values: %s", dialog.values)
     
-    # Example: Set field values
-    dialog.set_field_value("username", "test")
-    dialog.set_field_value("bio", "This is a test bio")
-    dialog.set_field_value("theme", "dark")
-    dialog.set_field_value("notifications", "email,sms")  # Comma-delimited for checkgroup
-    dialog.set_field_value("role", "admin")
+    # Example: Set several field values at once
+    dialog.set_field_values({
+        "username": "test",
+        "bio": "This is a test bio",
+        "theme": "dark",
+        "notifications": "email,sms",  # Comma-delimited for checkgroup
+        "role": "admin",
+    })
     
-    logger.info(f"Updated dialog values: {dialog.values}")
+    if logger.isEnabledFor(logging.INFO):
+        _info("Updated dialog values: %s", dialog.values)
 
 
 def custom_action_callback(dialog):
     """Example callback for custom action button."""
-    logger.info("Custom action button clicked!")
-    values = dialog.values
-    logger.info(f"User: {values.get('username', 'N/A')}")
-    logger.info(f"Role: {values.get('role', 'N/A')}")
+    _info = logger.info
+    _info("Custom action button clicked!")
+    # Read the widget values once; dialog.values walks every field on each access
+    _get = dialog.values.get
+    _info("User: %s", _get('username', 'N/A'))
+    _info("Role: %s", _get('role', 'N/A'))
+
+
+# Button callbacks, frozen so the table can't be changed after import, and
+# registered so templates can refer to them as '@name'
+CALLBACKS = MappingProxyType({
+    "reset": reset_callback,
+    "custom_action": custom_action_callback,
+})
+for _name, _callback in CALLBACKS.items():
+    Dialog.register_callback(_name, _callback)
 
 
 def example_string_template():
     """Example using a string template."""
-    logger.info("\n" + "="*60)
-    logger.info("Example 1: String Template")
-    logger.info("="*60)
-    
-    template = """
-User Settings|500x450
-username|text
-bio|multiline
-theme|selection|light,dark,auto
-notifications|checkgroup|email,sms,push
-role|radio|admin,user,guest
-reset|button|main.reset_callback
-|divider
-custom_action|button|main.custom_action_callback
-"""
+    _info = logger.info
+    _err = logger.error
+    _info(_banner("Example 1: String Template"))
     
     try:
-        dialog = Dialog(template)
+        dialog = _USER_SETTINGS()
         result = dialog.show()
         
         if result:
-            logger.info("Dialog returned values:")
-            for key, value in result.items():
-                logger.info(f"  {key}: {value}")
+            _log_result("Dialog returned values:", result)
         else:
-            logger.info("Dialog was cancelled")
+            _info("Dialog was cancelled")
             
-    except Exception as e:
-        logger.error(f"Error creating dialog: {e}", exc_info=True)
+    except (DialogError, OSError, tk.TclError) as e:
+        _err("Error creating dialog: %s", e, exc_info=True)
 
 
-def example_file_template():
-    """Example using a template file."""
-    logger.info("\n" + "="*60)
-    logger.info("Example 2: File Template")
-    logger.info("="*60)
-    
-    # Create a sample template file
-    template_content = """
-Login Form|400x300
-username|text
-password|text
-remember|checkgroup|Remember me
-|divider
-"""
-    
-    template_file = Path("sample_template.txt")
+def example_file_template_inline():
+    """Example using the login form template straight from memory."""
+    _info = logger.info
+    _err = logger.error
+    _info(_banner("Example 2: Login Form Template"))
     
     try:
-        # Write template file
-        with open(template_file, 'w') as f:
-            f.write(template_content)
+        result = _LOGIN().show()
         
-        logger.info(f"Created template file: {template_file}")
+        if result:
+            _log_result("Login form returned:", result)
+        else:
+            _info("Login cancelled")
+            
+    except (DialogError, OSError, tk.TclError) as e:
+        _err("Error with login template: %s", e, exc_info=True)
+
+
+def example_file_template_disk():
+    """Example using a template file (exercises the file-loading path)."""
+    _info = logger.info
+    _err = logger.error
+    _info(_banner("Example 2b: File Template"))
+    
+    try:
+        # Write the template to a temp file that is removed when the block exits
+        with tempfile.NamedTemporaryFile('wb', suffix='.txt', delete_on_close=False) as tf:
+            tf.write(_LOGIN_SRC.encode('utf-8'))  # one raw write, no text-mode layer
+            tf.close()
+            template_file = Path(tf.name)
+            _info("Created template file: %s", template_file)
+            
+            # Create dialog from file; the template is fully read once parsed
+            dialog = create_dialog(template_file)
         
-        # Create dialog from file
-        dialog = create_dialog(template_file)
         result = dialog.show()
         
         if result:
-            logger.info("Login form returned:")
-            for key, value in result.items():
-                logger.info(f"  {key}: {value}")
+            _log_result("Login form returned:", result)
         else:
-            logger.info("Login cancelled")
+            _info("Login cancelled")
             
-    except Exception as e:
-        logger.error(f"Error with file template: {e}", exc_info=True)
-    finally:
-        # Clean up template file
-        if template_file.exists():
-            template_file.unlink()
-            logger.info(f"Removed template file: {template_file}")
+    except (DialogError, OSError, tk.TclError) as e:
+        _err("Error with file template: %s", e, exc_info=True)
 
 
 def example_simple_dialog():
     """Example of a simple dialog without custom buttons."""
-    logger.info("\n" + "="*60)
-    logger.info("Example 3: Simple Contact Form")
-    logger.info("="*60)
-    
-    template = """
-Contact Information|450x350
-full_name|text
-email|text
-phone|text
-preferred_contact|radio|email,phone,either
-message|multiline
-"""
+    _info = logger.info
+    _err = logger.error
+    _info(_banner("Example 3: Simple Contact Form"))
     
     try:
-        result = create_dialog(template).show()
+        result = _CONTACT().show()
         
         if result:
-            logger.info("Contact form submitted:")
-            for key, value in result.items():
-                logger.info(f"  {key}: {value}")
+            _log_result("Contact form submitted:", result)
         else:
-            logger.info("Contact form cancelled")
+            _info("Contact form cancelled")
             
-    except Exception as e:
-        logger.error(f"Error with simple dialog: {e}", exc_info=True)
+    except (DialogError, OSError, tk.TclError) as e:
+        _err("Error with simple dialog: %s", e, exc_info=True)
 
 
 def main():
     """Run example dialogs."""
-    # Setup logging
-    ProjectLogger(keep=7, level=logging.DEBUG).init()
+    # Setup logging once; importing ProjectLogger is deferred until it's needed
+    if not logging.getLogger().handlers:
+        from utils.logger import ProjectLogger
+        ProjectLogger(keep=7, level=logging.DEBUG).init()
     
     logger.info("Starting Dynamic Dialog Examples")
     
@@ -160,14 +207,12 @@ def main():
         # Run examples
         example_simple_dialog()
         example_string_template()
-        example_file_template()
+        example_file_template_inline()
         
-        logger.info("\n" + "="*60)
-        logger.info("All examples completed successfully!")
-        logger.info("="*60)
+        logger.info(_banner("All examples completed successfully!"))
         
     except Exception as e:
-        logger.error(f"Unexpected error in main: {e}", exc_info=True)
+        logger.error("Unexpected error in main: %s", e, exc_info=True)
 
 
 if __name__ == "__main__":